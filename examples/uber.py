@@ -25,6 +25,9 @@ DATA_URL = 'http://s3-us-west-2.amazonaws.com/streamlit-demo-data/uber-raw-data-
 
 st.title('Uber Example')
 
+# persist=True keeps the loaded data on disk across server restarts. And since
+# the server runs the script once at startup, before anyone connects, the
+# first visitor already gets a warm cache.
 @st.cache(persist=True)
 def load_data(nrows):
     data = pd.read_csv(DATA_URL, nrows=nrows)
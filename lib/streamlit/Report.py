@@ -195,36 +195,43 @@ class Report(object):
         """
         LOGGER.debug('Serializing final report')
 
-        messages = [
-            copy.deepcopy(msg) for msg in self._master_queue
-            if _should_save_report_msg(msg)
-        ]
-
+        # Build a list of message tuples: (message_location, serialized_message)
+        message_tuples = []
         first_delta_index = 0
         num_deltas = 0
-        for idx in range(len(messages)):
-            if messages[idx].HasField('delta'):
-                messages[idx].metadata.delta_id = num_deltas
+
+        for msg in self._master_queue:
+            if not _should_save_report_msg(msg):
+                continue
+
+            if msg.HasField('delta'):
                 if num_deltas == 0:
-                    first_delta_index = idx
+                    first_delta_index = len(message_tuples)
+
+                # Saved deltas must have contiguous IDs. Only copy the message
+                # when its ID actually changes, and let the copy go as soon as
+                # it's serialized, so we never hold a second copy of the whole
+                # report in memory.
+                if msg.metadata.delta_id != num_deltas:
+                    msg = copy.deepcopy(msg)
+                    msg.metadata.delta_id = num_deltas
                 num_deltas += 1
 
+            message_tuples.append((
+                'reports/%(id)s/%(idx)s.pb' %
+                    {'id': self.report_id, 'idx': len(message_tuples)},
+                msg.SerializeToString()
+            ))
+
         manifest = self._build_manifest(
             status='done',
-            num_messages=len(messages),
+            num_messages=len(message_tuples),
             first_delta_index=first_delta_index,
             num_deltas=num_deltas,
         )
 
         manifest_json = json.dumps(manifest).encode('utf-8')
 
-        # Build a list of message tuples: (message_location, serialized_message)
-        message_tuples = [(
-            'reports/%(id)s/%(idx)s.pb' %
-                {'id': self.report_id, 'idx': msg_idx},
-            msg.SerializeToString()
-        ) for msg_idx, msg in enumerate(messages)]
-
         manifest_tuples = [(
             'reports/%(id)s/manifest.json' %
                 {'id': self.report_id}, manifest_json)]
@@ -36,6 +36,10 @@ class ReportQueue(object):
         self._lock = threading.Lock()
 
         with self._lock:
+            # A list rather than a deque: enqueue() composes deltas by
+            # overwriting them at arbitrary indices, which a deque does in
+            # O(n), and nothing ever pops from the front. flush() and clear()
+            # swap in a new list instead of emptying this one.
             self._queue = []
 
             # Map: (delta_path, msg.metadata.delta_id) -> _queue.indexof(msg),
@@ -50,6 +54,12 @@ class ReportQueue(object):
         }
 
     def __iter__(self):
+        """Iterate over the queued messages without copying or flushing them.
+
+        This is how the whole report is read back (e.g. to save it), so it
+        must stay cheap: a flush() or clear() swaps in a fresh list rather than
+        emptying this one, so an iteration in progress is never cut short.
+        """
         return iter(self._queue)
 
     def is_empty(self):
@@ -85,26 +95,22 @@ class ReportQueue(object):
                     index = self._delta_index_map[delta_key]
                     old_msg = self._queue[index]
                     composed_delta = compose_deltas(old_msg.delta, msg.delta)
-                    new_msg = ForwardMsg()
-                    new_msg.delta.CopyFrom(composed_delta)
-                    new_msg.metadata.CopyFrom(msg.metadata)
-                    self._queue[index] = new_msg
+                    if composed_delta is msg.delta:
+                        # The new delta simply replaces the old one, so
+                        # store the message as-is, like we do when appending.
+                        # Only a real composition needs a message of its own.
+                        self._queue[index] = msg
+                    else:
+                        new_msg = ForwardMsg()
+                        new_msg.delta.CopyFrom(composed_delta)
+                        new_msg.metadata.CopyFrom(msg.metadata)
+                        self._queue[index] = new_msg
                 else:
                     # Append this message to the queue, and store its index
                     # for future combining.
                     self._delta_index_map[delta_key] = len(self._queue)
                     self._queue.append(msg)
 
-    def clone(self):
-        """Return the elements of this ReportQueue as a collections.deque."""
-        r = ReportQueue()
-
-        with self._lock:
-            r._queue = list(self._queue)
-            r._delta_index_map = dict(self._delta_index_map)
-
-        return r
-
     def _clear(self):
         self._queue = []
         self._delta_index_map = dict()
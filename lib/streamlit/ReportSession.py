@@ -217,7 +217,19 @@ class ReportSession(object):
                                      RerunData(argv, widget_state))
 
     def _on_source_file_changed(self):
-        """One of our source files changed. Schedule a rerun if appropriate."""
+        """One of our source files changed. Schedule a rerun if appropriate.
+
+        This is called on a file watcher thread. We hand the work off to the
+        main thread so the watcher can go back to listening right away, and
+        because _maybe_create_scriptrunner must only run on the main thread.
+        If the script is already running, the rerun request will stop it and
+        start over, and back-to-back requests get coalesced by our
+        ScriptRequestQueue.
+
+        """
+        self._ioloop.spawn_callback(self._handle_source_file_changed)
+
+    def _handle_source_file_changed(self):
         if self._run_on_save:
             self.request_rerun()
         else:
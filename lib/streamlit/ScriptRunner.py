@@ -244,22 +244,9 @@ class ScriptRunner(object):
             with open(self._report.script_path) as f:
                 filebody = f.read()
 
-            if config.get_option('runner.magicEnabled'):
-                filebody = magic.add_magic(filebody, self._report.script_path)
-
-            code = compile(
-                filebody,
-                # Pass in the file path so it can show up in exceptions.
-                self._report.script_path,
-                # We're compiling entire blocks of Python, so we need "exec"
-                # mode (as opposed to "eval" or "single").
-                mode='exec',
-                # Don't inherit any flags or "future" statements.
-                flags=0,
-                dont_inherit=1,
-                # Parameter not supported in Python2:
-                # optimize=-1,
-            )
+            code = _compile_script(
+                self._report.script_path, filebody,
+                config.get_option('runner.magicEnabled'))
 
         except BaseException as e:
             # We got a compile error. Send an error event and bail immediately.
@@ -426,3 +413,61 @@ def _log_if_error(fn):
         fn()
     except Exception as e:
         LOGGER.warning(e)
+
+
+# Map of script path -> (source, magic_enabled, code object) for the most
+# recent version of each script we compiled. Most reruns (e.g. after a widget
+# changes) run an unchanged script, so there's no need to add magic and
+# compile it again. Code objects are immutable, so they can be shared across
+# ScriptRunners.
+_compiled_scripts = {}
+
+
+def _compile_script(script_path, filebody, magic_enabled):
+    """Compile a script's source, reusing the last result if it's unchanged.
+
+    Parameters
+    ----------
+    script_path : str
+        The path of the script, so it can show up in exceptions.
+
+    filebody : str
+        The script's source code.
+
+    magic_enabled : bool
+        Whether to add magic to the source before compiling.
+
+    Returns
+    -------
+    code
+        The compiled code object.
+
+    """
+    cached = _compiled_scripts.get(script_path)
+    if cached is not None:
+        cached_filebody, cached_magic_enabled, cached_code = cached
+        if (cached_filebody == filebody and
+                cached_magic_enabled == magic_enabled):
+            return cached_code
+
+    if magic_enabled:
+        source = magic.add_magic(filebody, script_path)
+    else:
+        source = filebody
+
+    code = compile(
+        source,
+        # Pass in the file path so it can show up in exceptions.
+        script_path,
+        # We're compiling entire blocks of Python, so we need "exec"
+        # mode (as opposed to "eval" or "single").
+        mode='exec',
+        # Don't inherit any flags or "future" statements.
+        flags=0,
+        dont_inherit=1,
+        # Parameter not supported in Python2:
+        # optimize=-1,
+    )
+
+    _compiled_scripts[script_path] = (filebody, magic_enabled, code)
+    return code
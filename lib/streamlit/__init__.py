@@ -85,7 +85,6 @@ import threading as _threading
 import traceback as _traceback
 import types as _types
 import json as _json
-import numpy as _np
 
 from streamlit import code_util as _code_util
 from streamlit import util as _util
@@ -307,8 +306,10 @@ def write(*args):
             if isinstance(arg, string_types):  # noqa: F821
                 string_buffer.append(arg)
             elif type(arg).__name__ in _DATAFRAME_LIKE_TYPES:
+                # Imported here so `import streamlit` doesn't pay for numpy.
+                import numpy as np
                 flush_buffer()
-                if len(_np.shape(arg)) > 2:
+                if len(np.shape(arg)) > 2:
                     text(arg)
                 else:
                     dataframe(arg)  # noqa: F821
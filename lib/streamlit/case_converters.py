@@ -20,6 +20,11 @@ setup_2_3_shims(globals())
 
 import re
 
+# Precompiled patterns for to_snake_case(): a word that starts with a capital
+# letter, and a lowercase letter or digit followed by a capital letter.
+_CAPITALIZED_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_LOWER_THEN_UPPER_RE = re.compile('([a-z0-9])([A-Z])')
+
 
 def to_upper_camel_case(snake_case_str):
     """Converts snake_case to UpperCamelCase.
@@ -52,8 +57,8 @@ def to_snake_case(camel_case_str):
         fooBar -> foo_bar
         BazBang -> baz_bang
     """
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_case_str)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAPITALIZED_WORD_RE.sub(r'\1_\2', camel_case_str)
+    return _LOWER_THEN_UPPER_RE.sub(r'\1_\2', s1).lower()
 
 
 def convert_dict_keys(func, in_dict):
@@ -305,6 +305,25 @@ _create_option(
     default_val=[])
 
 
+_create_option(
+    'server.fileWatcherDebounceMs',
+    description='''How long a watched file must go without further changes,
+        in milliseconds, before Streamlit reacts to it. Editors often write
+        a file several times per save, and this coalesces those writes into a
+        single rerun. Set to 0 to react to every change immediately.
+        ''',
+    default_val=250)
+
+
+_create_option(
+    'server.fileWatcherPollingIntervalSecs',
+    description='''How often, in seconds, to poll watched folders that live on
+        a network filesystem (e.g. NFS or SMB), where the OS doesn't reliably
+        report file changes.
+        ''',
+    default_val=1.0)
+
+
 @_create_option('server.headless')
 @util.memoize
 def _server_headless():
@@ -66,8 +66,13 @@ from __future__ import print_function, division, unicode_literals, absolute_impo
 from streamlit.compatibility import setup_2_3_shims
 setup_2_3_shims(globals())
 
+import collections
+import threading
+
 from streamlit import case_converters
 from streamlit.elements.lib.ChartComponent import ChartComponent
+from streamlit.elements.lib.ChartComponent import prop_key_to_lower_camel_case
+from streamlit.elements.lib.ChartComponent import prop_value_to_str
 import streamlit.elements.data_frame_proto as data_frame_proto
 import streamlit.elements.lib.chart_config as chart_config
 import streamlit.elements.lib.dict_builder as dict_builder
@@ -88,6 +93,8 @@ class Chart(object):
         ----------
         data : pandas.DataFrame, numpy.ndarray, Iterable, or dict
             Data to be plotted. Series are referenced by column name.
+            DataFrames are used as-is rather than copied, so they shouldn't
+            be mutated until the chart is marshalled.
 
         type : str
             A string with the snake-case chart type. Example: 'area_chart',
@@ -106,7 +113,6 @@ class Chart(object):
             ReChart's top-level element.
 
         """
-        import pandas as pd
         assert type in chart_config.CHART_TYPES_SNAKE, \
             'Did not recognize "%s" type.' % type
         self._data = data_frame_proto.convert_anything_to_df(data)
@@ -114,7 +120,7 @@ class Chart(object):
         self._width = width
         self._height = height
         self._components = list()
-        self._props = [(str(k), str(v)) for (k, v) in kwargs.items()]
+        self._props = kwargs
 
     def append_component(self, component_name, props):
         """Set a chart component.
@@ -131,7 +137,7 @@ class Chart(object):
 
     def marshall(self, proto_chart):
         """Load this chart data into that proto_chart."""
-        proto_chart.type = case_converters.to_upper_camel_case(self._type)
+        proto_chart.type = chart_config.CHART_TYPES_UPPER_CAMEL[self._type]
         data_frame_proto.marshall_data_frame(self._data, proto_chart.data)
         proto_chart.width = self._width
         proto_chart.height = self._height
@@ -142,10 +148,10 @@ class Chart(object):
             proto_component = proto_chart.components.add()
             component.marshall(proto_component)
 
-        for (key, value) in self._props:
+        for (key, value) in self._props.items():
             proto_prop = proto_chart.props.add()
-            proto_prop.key = case_converters.to_lower_camel_case(key)
-            proto_prop.value = value
+            proto_prop.key = prop_key_to_lower_camel_case(key)
+            proto_prop.value = prop_value_to_str(value)
 
     def _append_missing_data_components(self):
         """Append all required data components that have not been specified.
@@ -156,65 +162,131 @@ class Chart(object):
         (specified via ForEachColumn), and their children can use special
         identifiers such as ColumnAtCurrentIndex, and ValueCycler.
         """
-        required_components = chart_config.REQUIRED_COMPONENTS.get(
-            self._type, None)
-
-        if required_components is None:
-            return
+        # Key on the column names as strings: labels like 1 and True compare
+        # (and hash) equal but are drawn differently, and the props they end
+        # up in are stringified anyway.
+        required_components = _get_required_components(
+            self._type, tuple(map(str, self._data.columns)))
 
         existing_component_names = set(c.type for c in self._components)
 
-        for required_component in required_components:
-
-            if isinstance(required_component, dict_builder.ForEachColumn):
-                numRepeats = len(self._data.columns)
-                comp_name, comp_value = required_component.content_to_repeat
-            else:
-                numRepeats = 1
-                comp_name, comp_value = required_component
-
-            if comp_name in existing_component_names:
-                continue
-
-            for i in range(numRepeats):
-                if isinstance(comp_value, dict_types):  # noqa: F821
-                    props = dict(
-                        (k, self._materializeValue(v, i))
-                        for (k, v) in comp_value.items()
-                    )
-                else:
-                    props = self._materializeValue(comp_value, i)
+        for comp_name, props in required_components:
+            if comp_name not in existing_component_names:
                 self.append_component(comp_name, props)
 
-    def _materializeValue(self, value, currCycle):
-        """Replace ColumnAtCurrentIndex, etc with a column name if needed.
 
-        Parameters
-        ----------
-        value : anything
-            If value is a ColumnAtCurrentIndex then it gets replaces with a
-            column name. If ValueCycler, it returns the current item in the
-            cycler's list. If it's anything else, it just passes through.
+# Cache of (chart type, column names) -> required components. See
+# _get_required_components().
+_required_components_cache = collections.OrderedDict()
+_required_components_cache_lock = threading.Lock()
+_REQUIRED_COMPONENTS_CACHE_SIZE = 256
 
-        currCycle : int
-            For repeated fields (denoted via ForEachColumn) this is the number
-            of the current column.
 
-        """
-        if value == dict_builder.CURRENT_COLUMN_NAME:
-            i = currCycle
-            if i >= len(self._data.columns):
-                raise IndexError('Index %s out of bounds' % i)
-            return self._data.columns[i]
+def _get_required_components(chart_type, columns):
+    """Return the materialized required components for a chart.
+
+    The result only depends on the chart type and the data's column names,
+    and the same chart tends to get re-drawn with the same columns on every
+    rerun, so results are cached.
+
+    Parameters
+    ----------
+    chart_type : str
+        The snake-case chart type.
+
+    columns : tuple of str
+        The column names of the chart's data, as strings.
+
+    Returns
+    -------
+    tuple
+        2-tuples of (component name, props) for every required component of
+        this chart type, in order. The props must not be mutated.
+
+    """
+    key = (chart_type, columns)
+
+    with _required_components_cache_lock:
+        components = _required_components_cache.pop(key, None)
+
+        if components is None:
+            components = _build_required_components(chart_type, columns)
+
+            # Evict the least recently used entry.
+            if (len(_required_components_cache) >=
+                    _REQUIRED_COMPONENTS_CACHE_SIZE):
+                _required_components_cache.popitem(last=False)
 
-        elif value == dict_builder.INDEX_COLUMN_NAME:
-            return dict_builder.INDEX_COLUMN_DESIGNATOR
+        # (Re)insert the key, so it's now the most recently used.
+        _required_components_cache[key] = components
 
-        elif isinstance(value, dict_builder.ValueCycler):
-            return value.get(currCycle)
+    return components
 
+
+def _build_required_components(chart_type, columns):
+    """Uncached implementation of _get_required_components."""
+    required_components = chart_config.REQUIRED_COMPONENTS.get(
+        chart_type, None)
+
+    if required_components is None:
+        return ()
+
+    components = []
+
+    for required_component in required_components:
+
+        if isinstance(required_component, dict_builder.ForEachColumn):
+            numRepeats = len(columns)
+            comp_name, comp_value = required_component.content_to_repeat
         else:
-            return value
+            numRepeats = 1
+            comp_name, comp_value = required_component
+
+        for i in range(numRepeats):
+            if isinstance(comp_value, dict_types):  # noqa: F821
+                props = dict(
+                    (k, _materialize_value(v, i, columns))
+                    for (k, v) in comp_value.items()
+                )
+            else:
+                props = _materialize_value(comp_value, i, columns)
+            components.append((comp_name, props))
+
+    return tuple(components)
+
+
+def _materialize_value(value, currCycle, columns):
+    """Replace ColumnAtCurrentIndex, etc with a column name if needed.
+
+    Parameters
+    ----------
+    value : anything
+        If value is a ColumnAtCurrentIndex then it gets replaces with a
+        column name. If ValueCycler, it returns the current item in the
+        cycler's list. If it's anything else, it just passes through.
+
+    currCycle : int
+        For repeated fields (denoted via ForEachColumn) this is the number
+        of the current column.
+
+    columns : tuple of str
+        The column names of the chart's data, as strings.
+
+    """
+    if value == dict_builder.CURRENT_COLUMN_NAME:
+        i = currCycle
+        if i >= len(columns):
+            raise IndexError('Index %s out of bounds' % i)
+        return columns[i]
+
+    elif value == dict_builder.INDEX_COLUMN_NAME:
+        return dict_builder.INDEX_COLUMN_DESIGNATOR
+
+    elif isinstance(value, dict_builder.ValueCycler):
+        return value.get(currCycle)
+
+    else:
+        return value
 
 
 def register_component(component_name, implemented):
@@ -19,6 +19,28 @@ from streamlit.compatibility import setup_2_3_shims
 setup_2_3_shims(globals())
 
 from streamlit import case_converters
+import streamlit.elements.lib.chart_config as chart_config
+
+# Cache of snake-case prop key -> lower-camel-case prop key. Charts tend to use
+# the same handful of props over and over, so this saves us from converting
+# them on every marshall.
+_lower_camel_case_prop_keys = {}
+
+
+def prop_key_to_lower_camel_case(key):
+    """Convert a snake-case prop key to the lower-camel-case ReCharts uses."""
+    camel_key = _lower_camel_case_prop_keys.get(key)
+    if camel_key is None:
+        camel_key = case_converters.to_lower_camel_case(key)
+        _lower_camel_case_prop_keys[key] = camel_key
+    return camel_key
+
+
+def prop_value_to_str(value):
+    """Convert a prop value to the string the Chart proto expects."""
+    if isinstance(value, string_types):  # noqa: F821
+        return value
+    return str(value)
 
 
 class ChartComponent(object):
@@ -30,19 +52,22 @@ class ChartComponent(object):
         type : str
             A snake-case string with the component name.
         props : dict
-            The ReCharts component value as a dict.
+            The ReCharts component value as a dict. This is not copied, so
+            it must not be mutated afterwards.
 
         """
         self._type = type
-        self._props = [(str(k), str(v)) for (k,v) in props.items()]
+        self._props = props
 
     @property
     def type(self):
         return self._type
 
     def marshall(self, proto_component):
-        proto_component.type = case_converters.to_upper_camel_case(self._type)
-        for (key, value) in self._props:
+        proto_component.type = (
+            chart_config.CHART_COMPONENTS_UPPER_CAMEL.get(self._type) or
+            case_converters.to_upper_camel_case(self._type))
+        for (key, value) in self._props.items():
             proto_prop = proto_component.props.add()
-            proto_prop.key = case_converters.to_lower_camel_case(key)
-            proto_prop.value = value
+            proto_prop.key = prop_key_to_lower_camel_case(str(key))
+            proto_prop.value = prop_value_to_str(value)
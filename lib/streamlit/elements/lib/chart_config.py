@@ -40,6 +40,11 @@ CHART_TYPES = set([
 # Streamlit.
 CHART_TYPES_SNAKE = set(map(case_converters.to_snake_case, CHART_TYPES))
 
+# Map of snake-case chart type -> the upper-camel-case name ReCharts expects.
+# Precomputed so marshalling a chart doesn't have to convert it every time.
+CHART_TYPES_UPPER_CAMEL = dict(
+    (t, case_converters.to_upper_camel_case(t)) for t in CHART_TYPES_SNAKE)
+
 # Map of string->boolean, mapping ReChart component names to true/false
 # depending on whether Streamlit supports that component.
 # See http://recharts.org/#/en-US/api
@@ -90,6 +95,12 @@ CHART_COMPONENTS = {
     'Sector': False,
 }
 
+# Map of snake-case component name -> the upper-camel-case name ReCharts
+# expects. Precomputed for the same reason as CHART_TYPES_UPPER_CAMEL.
+CHART_COMPONENTS_UPPER_CAMEL = dict(
+    (snake, case_converters.to_upper_camel_case(snake))
+    for snake in map(case_converters.to_snake_case, CHART_COMPONENTS))
+
 
 BASIC_REQUIRED_COMPONENTS = (
     ('cartesian_grid', {
@@ -95,7 +95,8 @@ class Server(object):
         self._script_path = script_path
         self._script_argv = script_argv
 
-        # Mapping of WebSocket->ReportSession.
+        # Mapping of WebSocket->ReportSession. Keyed by the socket so that
+        # disconnecting a browser is O(1) however many are connected.
         self._report_sessions = {}
 
         self._must_stop = threading.Event()
@@ -204,6 +205,10 @@ class Server(object):
                         continue
                     if ws is None:
                         continue
+                    # Send everything this session queued up since the last
+                    # tick in one go, and only then yield to the IOLoop,
+                    # rather than paying a round trip through the IOLoop for
+                    # every message.
                     msg_list = session.flush_browser_queue()
                     for msg in msg_list:
                         msg_str = serialize_forward_msg(msg)
@@ -211,7 +216,7 @@ class Server(object):
                             ws.write_message(msg_str, binary=True)
                         except tornado.websocket.WebSocketClosedError:
                             self._remove_browser_connection(ws)
-                        yield
+                            break
                     yield
 
             elif self._state == State.NO_BROWSERS_CONNECTED:
@@ -289,9 +294,8 @@ class Server(object):
         return self._report_sessions[ws]
 
     def _remove_browser_connection(self, ws):
-        if ws in self._report_sessions:
-            session = self._report_sessions[ws]
-            del self._report_sessions[ws]
+        session = self._report_sessions.pop(ws, None)
+        if session is not None:
             session.shutdown()
 
         if len(self._report_sessions) == 0:
@@ -38,6 +38,11 @@ from streamlit.logger import get_logger
 LOGGER = get_logger(__name__)
 
 
+# Files that signal to readers that all files uploaded before them are in
+# place, so they must be uploaded strictly in order.
+_ORDERED_FILENAMES = frozenset(['index.html', 'manifest.json'])
+
+
 class S3Storage(AbstractStorage):
     """Class to handle S3 uploads."""
 
@@ -195,24 +200,66 @@ class S3Storage(AbstractStorage):
 
     @gen.coroutine
     def _s3_upload_files(self, files, progress_coroutine):
+        """Upload files to S3, several at a time.
+
+        Files whose presence tells readers that the files before them are
+        complete (see _ORDERED_FILENAMES) act as barriers: they are only
+        uploaded once everything before them is done, and nothing after them
+        starts until they're done. Everything else is uploaded concurrently
+        on our executor.
+        """
         set_private_acl = config.get_option('s3.requireLoginToView')
-        for i, (path, data) in enumerate(files):
-            mime_type = mimetypes.guess_type(path)[0]
-            if not mime_type:
-                mime_type = 'application/octet-stream'
-            if set_private_acl and path.startswith('report'):
-                acl = 'private'
-            else:
-                acl = 'public-read'
-            self._s3_client.put_object(
-                Bucket=self._bucketname,
-                Body=data,
-                Key=self._s3_key(path),
-                ContentType=mime_type,
-                ACL=acl)
-            LOGGER.debug('Uploaded: "%s"', path)
+        num_uploaded = 0
+        uploads = []
+
+        for path, data in files:
+            is_barrier = os.path.basename(path) in _ORDERED_FILENAMES
+
+            if is_barrier:
+                num_uploaded = yield self._wait_for_uploads(
+                    uploads, num_uploaded, len(files), progress_coroutine)
+                uploads = []
+
+            uploads.append(self._s3_upload_file(path, data, set_private_acl))
+
+            if is_barrier:
+                num_uploaded = yield self._wait_for_uploads(
+                    uploads, num_uploaded, len(files), progress_coroutine)
+                uploads = []
+
+        yield self._wait_for_uploads(
+            uploads, num_uploaded, len(files), progress_coroutine)
+
+    @gen.coroutine
+    def _wait_for_uploads(
+            self, uploads, num_uploaded, num_files, progress_coroutine):
+        """Wait for the given uploads, reporting progress as each finishes.
+
+        Returns the new number of uploaded files.
+        """
+        for upload in uploads:
+            yield upload
+            num_uploaded += 1
 
             if progress_coroutine:
-                yield progress_coroutine(math.ceil(100 * (i + 1) / len(files)))
-            else:
-                yield
+                yield progress_coroutine(
+                    math.ceil(100 * num_uploaded / num_files))
+
+        raise gen.Return(num_uploaded)
+
+    @run_on_executor
+    def _s3_upload_file(self, path, data, set_private_acl):
+        mime_type = mimetypes.guess_type(path)[0]
+        if not mime_type:
+            mime_type = 'application/octet-stream'
+        if set_private_acl and path.startswith('report'):
+            acl = 'private'
+        else:
+            acl = 'public-read'
+        self._s3_client.put_object(
+            Bucket=self._bucketname,
+            Body=data,
+            Key=self._s3_key(path),
+            ContentType=mime_type,
+            ACL=acl)
+        LOGGER.debug('Uploaded: "%s"', path)
@@ -85,7 +85,7 @@ def streamlit_read(path, binary=False):
     mode = 'r'
     if binary:
         mode += 'b'
-    with open(os.path.join(STREAMLIT_ROOT_DIRECTORY, path), mode) as handle:
+    with open(filename, mode) as handle:
         yield handle
 
 
@@ -361,24 +361,23 @@ def _is_list_of_plotly_objs(obj):
     return all(_is_plotly_obj(item) for item in obj)
 
 
+# Keys a dict may have and still be treated as a Plotly figure.
+_PLOTLY_DICT_KEYS = frozenset(['config', 'data', 'frames', 'layout'])
+
+
 def _is_probably_plotly_dict(obj):
     if type(obj) not in dict_types:
         return False
 
-    if len(obj.keys()) == 0:
+    if len(obj) == 0:
         return False
 
-    if any(k not in ['config', 'data', 'frames', 'layout']
-           for k in obj.keys()):
+    if not _PLOTLY_DICT_KEYS.issuperset(obj.keys()):
         return False
 
-    if any(_is_plotly_obj(v) for v in obj.values()):
-        return True
-
-    if any(_is_list_of_plotly_objs(v) for v in obj.values()):
-        return True
-
-    return False
+    return any(
+        _is_plotly_obj(v) or _is_list_of_plotly_objs(v)
+        for v in obj.values())
 
 
 def is_repl():
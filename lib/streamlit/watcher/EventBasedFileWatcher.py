@@ -23,7 +23,8 @@ How these classes work together
   _MultiFileWatcher to watch files.
 
 - _MultiFileWatcher : singleton that watches multiple files. It does this by
-  holding a watchdog.observer.Observer object, and manages several
+  holding a watchdog.observer.Observer object (plus a PollingObserver for
+  folders on network filesystems), and manages several
   _FolderEventHandler instances. This creates _FolderEventHandlers as needed,
   if the required folder is not already being watched. And it also tells
   existing _FolderEventHandlers which files it should be watching for.
@@ -45,9 +46,11 @@ import threading
 
 from blinker import Signal, ANY
 
+from streamlit import config
 from streamlit.watcher import util
 from watchdog import events
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from streamlit.logger import get_logger
 LOGGER = get_logger(__name__)
@@ -126,9 +129,35 @@ class _MultiFileWatcher(object):
 
         # The Observer object from the Watchdog module. Since this class is
         # only instantiated once, we only have a single Observer in Streamlit,
-        # and it's in charge of watching all paths we're interested in.
-        self._observer = Observer()
-        self._observer.start()  # Start observer thread.
+        # and it's in charge of watching all paths we're interested in. Each
+        # watched folder is just a schedule()d watch on it. The observer
+        # thread is only started once the first folder gets watched.
+        self._observer = None
+
+        # Native file notifications don't work reliably on network
+        # filesystems, so folders there are watched by this PollingObserver
+        # instead. It's only created if one such folder gets watched.
+        self._polling_observer = None
+
+    def _get_observer_for_folder(self, folder_path):
+        """Return the observer that should watch the given folder.
+
+        Starts the observer if this is the first folder it will watch.
+        """
+        if not util.folder_is_on_network_filesystem(folder_path):
+            if self._observer is None:
+                LOGGER.debug('Starting observer')
+                self._observer = Observer()
+                self._observer.start()  # Start observer thread.
+            return self._observer
+
+        if self._polling_observer is None:
+            LOGGER.debug('Starting polling observer for %s', folder_path)
+            self._polling_observer = PollingObserver(timeout=config.get_option(
+                'server.fileWatcherPollingIntervalSecs'))
+            self._polling_observer.start()
+
+        return self._polling_observer
 
     def watch_file(self, file_path, callback):
         """Start watching a file.
@@ -151,7 +180,9 @@ class _MultiFileWatcher(object):
                 folder_handler = _FolderEventHandler()
                 self._folder_handlers[folder_path] = folder_handler
 
-                folder_handler.watch = self._observer.schedule(
+                folder_handler.observer = self._get_observer_for_folder(
+                    folder_path)
+                folder_handler.watch = folder_handler.observer.schedule(
                     folder_handler, folder_path, recursive=False)
 
             folder_handler.add_file_change_listener(file_path, callback)
@@ -182,12 +213,18 @@ class _MultiFileWatcher(object):
             folder_handler.remove_file_change_listener(file_path, callback)
 
             if not folder_handler.is_watching_files():
-                self._observer.unschedule(folder_handler.watch)
+                folder_handler.observer.unschedule(folder_handler.watch)
                 del self._folder_handlers[folder_path]
 
     def close(self):
+        """Close this _MultiFileWatcher object forever.
+
+        A subsequent call to get_singleton() will create a new one.
+        """
         with self._lock:
-            """Close this _MultiFileWatcher object forever."""
+            for folder_handler in self._folder_handlers.values():
+                folder_handler.cancel_pending_checks()
+
             if len(self._folder_handlers) != 0:
                 self._folder_handlers = {}
                 LOGGER.debug(
@@ -196,8 +233,16 @@ class _MultiFileWatcher(object):
             else:
                 LOGGER.debug('Stopping observer thread')
 
-            self._observer.stop()
-            self._observer.join(timeout=5)
+            for observer in (self._observer, self._polling_observer):
+                if observer is not None:
+                    observer.stop()
+                    observer.join(timeout=5)
+
+            self._observer = None
+            self._polling_observer = None
+
+            if _MultiFileWatcher._singleton is self:
+                _MultiFileWatcher._singleton = None
 
 
 class WatchedFile(object):
@@ -226,6 +271,24 @@ class _FolderEventHandler(events.FileSystemEventHandler):
         self._watched_files = {}
         self._lock = threading.Lock()  # for watched_files mutations
 
+        # The observer this handler is scheduled on, and the resulting watch.
+        # These are set by _MultiFileWatcher.
+        self.observer = None
+        self.watch = None
+
+        # Editors often emit several events for a single save, so we wait
+        # until a file has been quiet for this long before checking it.
+        self._debounce_secs = (
+            config.get_option('server.fileWatcherDebounceMs') / 1000.0)
+
+        # Map of file_path -> threading.Timer for checks that haven't run yet.
+        self._pending_checks = {}
+        self._pending_checks_lock = threading.Lock()
+
+        # Checks run on their timers' threads, so this makes them run one at
+        # a time, like they would on the observer thread.
+        self._check_lock = threading.Lock()
+
     def add_file_change_listener(self, file_path, callback):
         """Add a file to this object's event filter.
 
@@ -263,6 +326,7 @@ class _FolderEventHandler(events.FileSystemEventHandler):
             watched_file.on_file_changed.disconnect(callback)
             if not watched_file.on_file_changed.has_receivers_for(ANY):
                 del self._watched_files[file_path]
+                self._cancel_pending_check(file_path)
 
     def is_watching_files(self):
         """Return true if this object has 1+ files in its event filter."""
@@ -302,13 +366,74 @@ class _FolderEventHandler(events.FileSystemEventHandler):
 
         file_path = os.path.abspath(file_path)
 
-        file_info = self._watched_files.get(file_path, None)
-        if file_info is None:
+        if file_path not in self._watched_files:
             LOGGER.debug(
                 'Ignoring file %s.\nWatched_files: %s',
                 file_path, self._watched_files)
             return
 
+        if self._debounce_secs <= 0:
+            self._check_file_changed(file_path)
+            return
+
+        # Restart the countdown for this file, so a burst of events results
+        # in a single check once the burst is over.
+        def on_debounce_elapsed():
+            self._on_debounce_elapsed(file_path, timer)
+
+        timer = threading.Timer(self._debounce_secs, on_debounce_elapsed)
+        timer.daemon = True
+
+        with self._pending_checks_lock:
+            pending_check = self._pending_checks.get(file_path)
+            if pending_check is not None:
+                pending_check.cancel()
+            self._pending_checks[file_path] = timer
+
+        timer.start()
+
+    def _cancel_pending_check(self, file_path):
+        with self._pending_checks_lock:
+            pending_check = self._pending_checks.pop(file_path, None)
+        if pending_check is not None:
+            pending_check.cancel()
+
+    def cancel_pending_checks(self):
+        """Cancel all checks that are still waiting for their debounce."""
+        with self._pending_checks_lock:
+            pending_checks = list(self._pending_checks.values())
+            self._pending_checks = {}
+        for pending_check in pending_checks:
+            pending_check.cancel()
+
+    def _on_debounce_elapsed(self, file_path, timer):
+        with self._pending_checks_lock:
+            # If this timer was superseded by a newer one, or cancelled after
+            # it had already started firing, leave the map alone: the newer
+            # timer (if any) will do the check.
+            if self._pending_checks.get(file_path) is not timer:
+                return
+            del self._pending_checks[file_path]
+        self._check_file_changed(file_path)
+
+    def _check_file_changed(self, file_path):
+        """Fire the file's callbacks if its mtime and MD5 changed.
+
+        Parameters
+        ----------
+        file_path : str
+            The absolute path of a watched file.
+
+        """
+        with self._check_lock:
+            self._check_file_changed_locked(file_path)
+
+    def _check_file_changed_locked(self, file_path):
+        file_info = self._watched_files.get(file_path, None)
+        if file_info is None:
+            LOGGER.debug('File is no longer watched: %s', file_path)
+            return
+
         modification_time = os.stat(file_path).st_mtime
         if modification_time == file_info.modification_time:
             LOGGER.debug('File timestamp did not change: %s', file_path)
@@ -325,6 +450,29 @@ class _FolderEventHandler(events.FileSystemEventHandler):
         file_info.md5 = new_md5
         file_info.on_file_changed.send(file_path)
 
+    def dispatch(self, event):
+        """Drop events about files we don't watch, then dispatch the rest.
+
+        The observer watches the whole folder, so changes to unrelated files
+        (such as editors' swap and backup files) would otherwise go through
+        the full dispatch and restart the debounce countdown.
+
+        Parameters
+        ----------
+        event : FileSystemEvent
+            The event object representing the file system event.
+
+        """
+        if event.event_type == events.EVENT_TYPE_MOVED:
+            file_path = event.dest_path
+        else:
+            file_path = event.src_path
+
+        if os.path.abspath(file_path) not in self._watched_files:
+            return
+
+        super(_FolderEventHandler, self).dispatch(event)
+
     def on_created(self, event):
         if event.is_directory:
             return
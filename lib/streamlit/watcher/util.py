@@ -25,8 +25,13 @@ from streamlit.compatibility import setup_2_3_shims
 setup_2_3_shims(globals())
 
 import hashlib
+import os
+import platform
 import time
 
+from streamlit.logger import get_logger
+LOGGER = get_logger(__name__)
+
 
 # How many times to try to grab the MD5 hash.
 _MAX_RETRIES = 5
@@ -34,6 +39,16 @@ _MAX_RETRIES = 5
 # How long to wait between retries.
 _RETRY_WAIT_SECS = 0.1
 
+# Filesystem types (as listed in /proc/mounts) whose changes aren't reliably
+# reported by inotify.
+_NETWORK_FILESYSTEM_TYPES = frozenset([
+    '9p', 'afs', 'ceph', 'cifs', 'davfs', 'fuse.sshfs', 'glusterfs', 'lustre',
+    'ncpfs', 'nfs', 'nfs4', 'smb3', 'smbfs',
+])
+
+# Return value of GetDriveTypeW for network drives.
+_WINDOWS_DRIVE_REMOTE = 4
+
 
 def calc_md5_with_blocking_retries(file_path):
     """Calculate the MD5 checksum of the given file.
@@ -72,3 +87,75 @@ def calc_md5_with_blocking_retries(file_path):
 
     # Use hexdigest() instead of digest(), so it's easier to debug.
     return md5.hexdigest()
+
+
+def folder_is_on_network_filesystem(folder_path):
+    """Return True if the given folder lives on a network filesystem.
+
+    The OS-level file notification APIs (inotify, ReadDirectoryChangesW)
+    don't work reliably on network mounts such as NFS or SMB, so folders
+    there need to be polled instead.
+
+    Parameters
+    ----------
+    folder_path : str
+        The absolute path of the folder to check.
+
+    Returns
+    -------
+    bool
+        True if the folder is known to be on a network filesystem. False if
+        it isn't, or if we couldn't tell.
+
+    """
+    system = platform.system()
+
+    try:
+        if system == 'Linux':
+            return _get_linux_filesystem_type(folder_path) in \
+                _NETWORK_FILESYSTEM_TYPES
+        elif system == 'Windows':
+            return _is_windows_remote_drive(folder_path)
+    except Exception as e:
+        # This is only used to pick a file watching strategy, so it's not
+        # worth crashing over.
+        LOGGER.debug(
+            'Could not get filesystem type of %s: %s', folder_path, e)
+
+    return False
+
+
+def _get_linux_filesystem_type(folder_path):
+    """Return the type of the filesystem mounted at folder_path, per
+    /proc/mounts. Returns None if no mount point matches."""
+    folder_path = os.path.realpath(folder_path)
+    best_mount_point = ''
+    best_fs_type = None
+
+    with open('/proc/mounts') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 3:
+                continue
+
+            # Spaces in mount points are escaped as octal.
+            mount_point = fields[1].replace('\\040', ' ')
+            fs_type = fields[2]
+
+            is_match = (
+                folder_path == mount_point or
+                folder_path.startswith(mount_point.rstrip('/') + '/'))
+
+            if is_match and len(mount_point) >= len(best_mount_point):
+                best_mount_point = mount_point
+                best_fs_type = fs_type
+
+    return best_fs_type
+
+
+def _is_windows_remote_drive(folder_path):
+    import ctypes
+
+    drive = os.path.splitdrive(os.path.abspath(folder_path))[0]
+    return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == \
+        _WINDOWS_DRIVE_REMOTE
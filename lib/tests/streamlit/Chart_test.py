@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018-2019 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for Chart.py."""
+
+import unittest
+
+import pandas as pd
+
+from streamlit.elements import Chart
+from streamlit.proto.Chart_pb2 import Chart as ChartProto
+
+df1 = pd.DataFrame({
+    'a': [1, 2, 3],
+    'b': [10, 20, 30],
+})
+
+
+def _marshall(chart):
+    proto = ChartProto()
+    chart.marshall(proto)
+    return proto
+
+
+class ChartTest(unittest.TestCase):
+    """Test marshalling Charts into protos."""
+
+    def test_marshall(self):
+        """Test that type, components and props are camel-cased."""
+        chart = Chart.Chart(df1, 'line_chart', width=100, stroke_dasharray='3 3')
+        proto = _marshall(chart)
+
+        self.assertEqual(proto.type, 'LineChart')
+        self.assertEqual(proto.width, 100)
+        self.assertEqual(
+            [(p.key, p.value) for p in proto.props],
+            [('strokeDasharray', '3 3')])
+
+        component_types = [c.type for c in proto.components]
+        self.assertEqual(component_types, [
+            'CartesianGrid', 'XAxis', 'YAxis', 'Tooltip', 'Legend',
+            'Line', 'Line'])
+
+        line_props = dict((p.key, p.value) for p in proto.components[5].props)
+        self.assertEqual(line_props['dataKey'], 'a')
+        self.assertEqual(line_props['isAnimationActive'], 'false')
+
+    def test_prop_values_are_stringified(self):
+        """Test that non-string prop values are converted to strings."""
+        chart = Chart.Chart(df1, 'line_chart', bar_gap=4, layout=None)
+        chart.legend(icon_size=10.5)
+        proto = _marshall(chart)
+
+        self.assertEqual(
+            sorted((p.key, p.value) for p in proto.props),
+            [('barGap', '4'), ('layout', 'None')])
+
+        legend = [c for c in proto.components if c.type == 'Legend'][0]
+        self.assertEqual(
+            [(p.key, p.value) for p in legend.props],
+            [('iconSize', '10.5')])
+
+    def test_user_components_are_not_overridden(self):
+        """Test that required components the user set aren't added again."""
+        chart = Chart.Chart(df1, 'bar_chart').x_axis(data_key='b')
+        proto = _marshall(chart)
+
+        x_axes = [c for c in proto.components if c.type == 'XAxis']
+        self.assertEqual(len(x_axes), 1)
+        self.assertEqual(
+            [(p.key, p.value) for p in x_axes[0].props],
+            [('dataKey', 'b')])
+
+    def test_required_components_are_cached(self):
+        """Test that required components are reused for the same columns."""
+        components1 = Chart._get_required_components('area_chart', ('a', 'b'))
+        components2 = Chart._get_required_components('area_chart', ('a', 'b'))
+        components3 = Chart._get_required_components('area_chart', ('a', 'c'))
+
+        self.assertIs(components1, components2)
+        self.assertIsNot(components1, components3)
+        self.assertEqual(components3[-1][1]['data_key'], 'c')
+
+    def test_equal_column_labels_are_not_confused(self):
+        """Test that labels that are equal but print differently stay apart."""
+        chart1 = Chart.Chart(pd.DataFrame({1: [1], 0: [2]}), 'line_chart')
+        chart2 = Chart.Chart(
+            pd.DataFrame({True: [1], False: [2]}), 'line_chart')
+
+        def data_keys(chart):
+            proto = _marshall(chart)
+            return [
+                p.value
+                for c in proto.components if c.type == 'Line'
+                for p in c.props if p.key == 'dataKey']
+
+        self.assertEqual(sorted(data_keys(chart1)), ['0', '1'])
+        self.assertEqual(sorted(data_keys(chart2)), ['False', 'True'])
@@ -60,6 +60,16 @@ class ReportQueueTest(unittest.TestCase):
         self.assertEqual(len(queue), 1)
         self.assertTrue(queue[0].initialize.config.sharing_enabled)
 
+    def test_iteration_survives_clear(self):
+        rq = ReportQueue()
+        rq.enqueue(INIT_MSG)
+
+        it = iter(rq)
+        rq.clear()
+
+        self.assertEqual(list(it), [INIT_MSG])
+        self.assertTrue(rq.is_empty())
+
     def test_enqueue_two(self):
         rq = ReportQueue()
         self.assertTrue(rq.is_empty())
@@ -113,6 +123,9 @@ class ReportQueueTest(unittest.TestCase):
         self.assertEqual(queue[1].metadata.delta_id, 0)
         self.assertEqual(queue[1].delta.new_element.text.body, 'text2')
 
+        # Replacing an element stores the new message without copying it.
+        self.assertIs(queue[1], TEXT_DELTA_MSG2)
+
     def test_simple_add_rows(self):
         rq = ReportQueue()
         self.assertTrue(rq.is_empty())
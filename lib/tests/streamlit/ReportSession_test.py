@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018-2019 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for ReportSession.py."""
+
+import unittest
+
+from mock import MagicMock, patch
+
+from streamlit.ReportSession import ReportSession
+
+
+class ReportSessionTest(unittest.TestCase):
+
+    @patch('streamlit.ReportSession.LocalSourcesWatcher')
+    def test_source_file_change_is_handled_on_ioloop(self, _):
+        """Test that the watcher thread only schedules the work."""
+        ioloop = MagicMock()
+        rs = ReportSession(ioloop, '/not/a/script.py', [])
+
+        with patch.object(rs, 'request_rerun') as request_rerun, \
+                patch.object(rs, '_enqueue_file_change_message') as enqueue:
+            rs._on_source_file_changed()
+
+            ioloop.spawn_callback.assert_called_once_with(
+                rs._handle_source_file_changed)
+            request_rerun.assert_not_called()
+            enqueue.assert_not_called()
+
+    @patch('streamlit.ReportSession.LocalSourcesWatcher')
+    def test_handle_source_file_changed(self, _):
+        """Test that a change reruns the script only if runOnSave is set."""
+        rs = ReportSession(MagicMock(), '/not/a/script.py', [])
+
+        with patch.object(rs, 'request_rerun') as request_rerun, \
+                patch.object(rs, '_enqueue_file_change_message') as enqueue:
+            rs._run_on_save = True
+            rs._handle_source_file_changed()
+            request_rerun.assert_called_once()
+            enqueue.assert_not_called()
+
+            request_rerun.reset_mock()
+            rs._run_on_save = False
+            rs._handle_source_file_changed()
+            request_rerun.assert_not_called()
+            enqueue.assert_called_once()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018-2019 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit test of Report.py."""
+
+import json
+import unittest
+
+from mock import patch
+
+from streamlit import config
+from streamlit.Report import Report
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tests import testutil
+
+INIT_MSG = ForwardMsg()
+INIT_MSG.initialize.config.sharing_enabled = True
+
+EMPTY_DELTA_MSG = ForwardMsg()
+EMPTY_DELTA_MSG.delta.new_element.empty.unused = True
+EMPTY_DELTA_MSG.metadata.delta_id = 0
+
+TEXT_DELTA_MSG = ForwardMsg()
+TEXT_DELTA_MSG.delta.new_element.text.body = 'text1'
+TEXT_DELTA_MSG.metadata.delta_id = 1
+
+
+class ReportTest(unittest.TestCase):
+
+    def test_serialize_final_report(self):
+        report = Report('/not/a/script.py', [])
+        report.enqueue(INIT_MSG)
+        report.enqueue(EMPTY_DELTA_MSG)
+        report.enqueue(TEXT_DELTA_MSG)
+
+        # Mock the config, so the memoized browser.serverPort isn't computed
+        # (and cached) here, under whatever config other tests leave behind.
+        mock_get_option = testutil.build_mock_config_get_option({
+            'browser.serverPort': 8501})
+        with patch.object(config, 'get_option', new=mock_get_option):
+            files = report.serialize_final_report_to_files()
+
+        # The empty delta is dropped, and the manifest goes last.
+        self.assertEqual(3, len(files))
+
+        init_path, init_data = files[0]
+        self.assertEqual(
+            'reports/%s/0.pb' % report.report_id, init_path)
+        self.assertEqual(INIT_MSG.SerializeToString(), init_data)
+
+        delta_path, delta_data = files[1]
+        self.assertEqual(
+            'reports/%s/1.pb' % report.report_id, delta_path)
+        delta_msg = ForwardMsg()
+        delta_msg.ParseFromString(delta_data)
+        self.assertEqual(0, delta_msg.metadata.delta_id)
+        self.assertEqual('text1', delta_msg.delta.new_element.text.body)
+
+        manifest_path, manifest_data = files[2]
+        self.assertEqual(
+            'reports/%s/manifest.json' % report.report_id, manifest_path)
+        manifest = json.loads(manifest_data.decode('utf-8'))
+        self.assertEqual(2, manifest['numMessages'])
+        self.assertEqual(1, manifest['firstDeltaIndex'])
+        self.assertEqual(1, manifest['numDeltas'])
+        self.assertEqual(8501, manifest['serverPort'])
+
+        # The report's own messages must not have been renumbered.
+        queued_msgs = list(report._master_queue)
+        self.assertEqual(1, queued_msgs[2].metadata.delta_id)
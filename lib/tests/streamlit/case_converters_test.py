@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Copyright 2018-2019 Streamlit Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""case_converters unit tests."""
+
+import unittest
+
+from streamlit import case_converters
+
+
+class CaseConvertersTest(unittest.TestCase):
+    """Test the snake_case/CamelCase converters."""
+
+    def test_to_snake_case(self):
+        self.assertEqual('foo_bar', case_converters.to_snake_case('fooBar'))
+        self.assertEqual('baz_bang', case_converters.to_snake_case('BazBang'))
+        self.assertEqual(
+            'http_server', case_converters.to_snake_case('HTTPServer'))
+        self.assertEqual('x2_axis', case_converters.to_snake_case('x2Axis'))
+
+    def test_to_camel_case(self):
+        self.assertEqual(
+            'FooBar', case_converters.to_upper_camel_case('foo_bar'))
+        self.assertEqual(
+            'fooBar', case_converters.to_lower_camel_case('foo_bar'))
+        self.assertEqual(
+            'fooBar', case_converters.to_lower_camel_case('fooBar'))
@@ -274,6 +274,8 @@ class ConfigTest(unittest.TestCase):
             u's3.secretAccessKey',
             u's3.url',
             u'server.enableCORS',
+            u'server.fileWatcherDebounceMs',
+            u'server.fileWatcherPollingIntervalSecs',
             u'server.folderWatchBlacklist',
             u'server.headless',
             u'server.liveSave',
@@ -27,6 +27,7 @@ from streamlit.ScriptRequestQueue import ScriptRequest
 from streamlit.ScriptRequestQueue import ScriptRequestQueue
 from streamlit.ScriptRunner import ScriptRunner
 from streamlit.ScriptRunner import ScriptRunnerEvent
+from streamlit.ScriptRunner import _compile_script
 from streamlit.proto.BlockPath_pb2 import BlockPath
 from streamlit.proto.Widget_pb2 import WidgetStates
 
@@ -254,6 +255,19 @@ class ScriptRunnerTest(unittest.TestCase):
                 ScriptRunnerEvent.SHUTDOWN
             ])
 
+    def test_compiled_script_is_reused(self):
+        """Tests that an unchanged script isn't compiled again."""
+        path = '/not/a/real/script.py'
+        code1 = _compile_script(path, 'a = 1', False)
+        code2 = _compile_script(path, 'a = 1', False)
+        code3 = _compile_script(path, 'a = 2', False)
+        code4 = _compile_script(path, 'a = 2', True)
+
+        self.assertIs(code1, code2)
+        self.assertIsNot(code2, code3)
+        self.assertIsNot(code3, code4)
+        self.assertEqual(path, code1.co_filename)
+
     def _assert_no_exceptions(self, scriptrunner):
         """Asserts that no uncaught exceptions were thrown in the
         scriptrunner's run thread.
@@ -18,9 +18,12 @@
 Copyright 2019 Streamlit Inc. All rights reserved.
 """
 import hashlib
+import threading
 import unittest
 
-from mock import patch
+from mock import Mock, patch
+import tornado.gen
+import tornado.testing
 
 from streamlit.storage.S3Storage import S3Storage
 from streamlit.config import set_option
@@ -57,3 +60,54 @@ class S3StorageTest(unittest.TestCase):
         idx = s3._web_app_url.index('/', 8)
         self.assertEqual(s3._web_app_url[0:idx],
                          'https://buckets.s3.amazonaws.com')
+
+
+class S3StorageUploadTest(tornado.testing.AsyncTestCase):
+    def tearDown(self):
+        set_option('global.sharingMode', 'off')
+        super(S3StorageUploadTest, self).tearDown()
+
+    @patch('streamlit.storage.AbstractStorage._get_static_files')
+    @tornado.testing.gen_test
+    def test_upload_files_keeps_barriers_in_order(self, static_files):
+        static_files.return_value = [('index.html', 'some data')], hashlib.md5()
+
+        set_option('global.sharingMode', 's3')
+        set_option('s3.bucket', 'buckets')
+        set_option('s3.accessKeyId', 'ACCESS_KEY_ID')
+        set_option('s3.secretAccessKey', 'SECRET_ACCESS_KEY')
+        s3 = S3Storage()
+
+        uploaded = []
+        lock = threading.Lock()
+
+        def put_object(Key, **kwargs):
+            with lock:
+                uploaded.append(Key.rsplit('/', 1)[-1])
+
+        s3._s3_client = Mock()
+        s3._s3_client.put_object.side_effect = put_object
+
+        files = [('static/%d.js' % i, b'') for i in range(5)]
+        files.append(('index.html', b''))
+        files.extend(('reports/id/%d.pb' % i, b'') for i in range(5))
+        files.append(('reports/id/manifest.json', b''))
+
+        progress = []
+
+        @tornado.gen.coroutine
+        def progress_coroutine(percent):
+            progress.append(percent)
+
+        yield s3._s3_upload_files(files, progress_coroutine)
+
+        self.assertEqual(12, len(uploaded))
+        self.assertEqual(
+            set('%d.js' % i for i in range(5)), set(uploaded[:5]))
+        self.assertEqual('index.html', uploaded[5])
+        self.assertEqual(
+            set('%d.pb' % i for i in range(5)), set(uploaded[6:11]))
+        self.assertEqual('manifest.json', uploaded[11])
+
+        self.assertEqual(12, len(progress))
+        self.assertEqual(100, progress[-1])
@@ -66,6 +66,14 @@ class UtilTest(unittest.TestCase):
             data = input.read()
         self.assertEqual('data', data)
 
+    @patch('streamlit.credentials.util.get_streamlit_file_path', mock_get_path)
+    def test_streamlit_read_opens_resolved_path(self):
+        """Test that streamlit.util.streamlit_read opens the file it checked."""
+        with patch('streamlit.util.open', mock_open(read_data='data')) as p:
+            with util.streamlit_read('file') as input:
+                input.read()
+            p.assert_called_once_with(FILENAME, 'r')
+
     @patch('streamlit.credentials.util.get_streamlit_file_path', mock_get_path)
     @patch('streamlit.util.open', mock_open(read_data=b'\xaa\xbb'))
     def test_streamlit_read_binary(self):
@@ -168,6 +176,15 @@ class UtilTest(unittest.TestCase):
         res = util.is_plotly_chart(d)
         self.assertFalse(res)
 
+    def test_data_dict_without_graph_objects_is_not_plotly_chart(self):
+        d = {
+            'data': [{'x': [1, 2, 3, 4], 'y': [10, 15, 13, 17]}],
+            'layout': {'width': 1000},
+        }
+
+        res = util.is_plotly_chart(d)
+        self.assertFalse(res)
+
     def test_fig_is_plotly_chart(self):
         trace1 = go.Scatter(
             x=[1, 2, 3, 4],
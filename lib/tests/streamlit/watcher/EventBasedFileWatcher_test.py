@@ -18,11 +18,13 @@ from __future__ import print_function, division, unicode_literals, absolute_impo
 from streamlit.compatibility import setup_2_3_shims
 setup_2_3_shims(globals())
 
+import threading
 import unittest
 import mock
 from watchdog import events
 
 from streamlit.watcher import EventBasedFileWatcher
+from tests import testutil
 
 
 class EventBasedFileWatcherTest(unittest.TestCase):
@@ -34,18 +36,27 @@ class EventBasedFileWatcherTest(unittest.TestCase):
         self.util_patcher = mock.patch(
             'streamlit.watcher.EventBasedFileWatcher.util')
         self.os_patcher = mock.patch('streamlit.watcher.EventBasedFileWatcher.os')
+        self.config_patcher = mock.patch(
+            'streamlit.watcher.EventBasedFileWatcher.config.get_option',
+            side_effect=testutil.build_mock_config_get_option({
+                'server.fileWatcherDebounceMs': 0,
+            }))
         self.MockObserverClass = self.observer_class_patcher.start()
         self.mock_util = self.util_patcher.start()
+        self.mock_util.folder_is_on_network_filesystem.return_value = False
         self.os = self.os_patcher.start()
+        self.config_patcher.start()
 
     def tearDown(self):
-        fo = EventBasedFileWatcher._MultiFileWatcher.get_singleton()
-        fo._observer.start.reset_mock()
-        fo._observer.schedule.reset_mock()
+        # Close the singleton so the next test starts with fresh observers.
+        fo = EventBasedFileWatcher._MultiFileWatcher._singleton
+        if fo is not None:
+            fo.close()
 
         self.observer_class_patcher.stop()
         self.util_patcher.stop()
         self.os_patcher.stop()
+        self.config_patcher.stop()
 
     def test_file_watch_and_callback(self):
         """Test that when a file is modified, the callback is called."""
@@ -74,6 +85,159 @@ class EventBasedFileWatcherTest(unittest.TestCase):
 
         ro.close()
 
+    def _watch_with_debounce(self, cb):
+        """Watch a file with debouncing on, and return its folder handler."""
+        self.os.stat = lambda x: FakeStat(101)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '1'
+
+        self.config_patcher.stop()
+        self.config_patcher = mock.patch(
+            'streamlit.watcher.EventBasedFileWatcher.config.get_option',
+            side_effect=testutil.build_mock_config_get_option({
+                'server.fileWatcherDebounceMs': 250,
+            }))
+        self.config_patcher.start()
+
+        ro = EventBasedFileWatcher.EventBasedFileWatcher(
+            '/this/is/my/file.py', cb)
+
+        fo = EventBasedFileWatcher._MultiFileWatcher.get_singleton()
+        folder_handler = fo._observer.schedule.call_args[0][0]
+
+        self.os.stat = lambda x: FakeStat(102)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '2'
+
+        return ro, folder_handler
+
+    def test_events_are_debounced(self):
+        """Test that a burst of events results in a single check."""
+        cb = mock.Mock()
+        ro, folder_handler = self._watch_with_debounce(cb)
+
+        with mock.patch(
+                'streamlit.watcher.EventBasedFileWatcher.threading.Timer') \
+                as MockTimer:
+            for _ in range(3):
+                ev = events.FileSystemEvent('/this/is/my/file.py')
+                ev.event_type = events.EVENT_TYPE_MODIFIED
+                folder_handler.on_modified(ev)
+
+            # Each event restarts the countdown, cancelling the previous one.
+            self.assertEqual(3, MockTimer.call_count)
+            self.assertEqual(2, MockTimer.return_value.cancel.call_count)
+            cb.assert_not_called()
+
+            # Fire the last timer.
+            _, fn = MockTimer.call_args[0]
+            fn()
+
+        cb.assert_called_once()
+
+        ro.close()
+
+    def test_superseded_timer_does_not_drop_newer_one(self):
+        """Test that a timer firing late leaves the newer timer pending."""
+        cb = mock.Mock()
+        ro, folder_handler = self._watch_with_debounce(cb)
+
+        timers = []
+
+        def make_timer(*args):
+            timers.append(mock.Mock())
+            return timers[-1]
+
+        with mock.patch(
+                'streamlit.watcher.EventBasedFileWatcher.threading.Timer',
+                side_effect=make_timer) as MockTimer:
+            for _ in range(2):
+                ev = events.FileSystemEvent('/this/is/my/file.py')
+                ev.event_type = events.EVENT_TYPE_MODIFIED
+                folder_handler.on_modified(ev)
+
+            # The first timer fires even though the second event cancelled it.
+            _, first_fn = MockTimer.call_args_list[0][0]
+            first_fn()
+            cb.assert_not_called()
+
+            # The second timer is still pending, so removing the file's last
+            # listener cancels it.
+            ro.close()
+            timers[1].cancel.assert_called_once()
+
+    def test_close_cancels_pending_checks(self):
+        """Test that closing the watcher cancels checks not yet run."""
+        cb = mock.Mock()
+        _, folder_handler = self._watch_with_debounce(cb)
+
+        with mock.patch(
+                'streamlit.watcher.EventBasedFileWatcher.threading.Timer') \
+                as MockTimer:
+            ev = events.FileSystemEvent('/this/is/my/file.py')
+            ev.event_type = events.EVENT_TYPE_MODIFIED
+            folder_handler.on_modified(ev)
+
+            EventBasedFileWatcher._MultiFileWatcher.get_singleton().close()
+            MockTimer.return_value.cancel.assert_called_once()
+
+            # Even if the timer was already firing, the check doesn't run.
+            _, fn = MockTimer.call_args[0]
+            fn()
+
+        cb.assert_not_called()
+
+    def test_overlapping_checks_run_one_at_a_time(self):
+        """Test that a check waits for one that's still computing the MD5."""
+        cb = mock.Mock()
+
+        mtime = [101]
+        self.os.stat = lambda x: FakeStat(mtime[0])
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '1'
+
+        folder_handler = EventBasedFileWatcher._FolderEventHandler()
+        folder_handler.add_file_change_listener('/this/is/my/file.py', cb)
+
+        md5_started = threading.Event()
+        md5_release = threading.Event()
+
+        def slow_md5(file_path):
+            md5_started.set()
+            md5_release.wait()
+            return '2'
+
+        def start_check():
+            check = threading.Thread(
+                target=folder_handler._check_file_changed,
+                args=['/this/is/my/file.py'])
+            check.daemon = True
+            check.start()
+            return check
+
+        mtime[0] = 102
+        self.mock_util.calc_md5_with_blocking_retries = slow_md5
+        check1 = start_check()
+        md5_started.wait()
+
+        try:
+            # The file is saved again while the first check is still running.
+            mtime[0] = 103
+            self.mock_util.calc_md5_with_blocking_retries = lambda x: '3'
+            check2 = start_check()
+
+            check2.join(timeout=0.1)
+            self.assertTrue(check2.is_alive())
+            cb.assert_not_called()
+        finally:
+            md5_release.set()
+
+        check1.join()
+        check2.join()
+
+        self.assertEqual(
+            [mock.call('/this/is/my/file.py')] * 2, cb.call_args_list)
+        watched_file = folder_handler._watched_files['/this/is/my/file.py']
+        self.assertEqual('3', watched_file.md5)
+        self.assertEqual(103, watched_file.modification_time)
+
     def test_callback_not_called_if_same_mtime(self):
         """Test that we ignore files with same mtime."""
         cb = mock.Mock()
@@ -159,6 +323,35 @@ class EventBasedFileWatcherTest(unittest.TestCase):
 
         ro.close()
 
+    def test_events_for_unwatched_files_are_dropped(self):
+        """Test that events for other files in the folder aren't dispatched."""
+        cb = mock.Mock()
+
+        self.os.path.abspath = lambda x: x
+        self.os.path.dirname = lambda x: x.rsplit('/', 1)[0]
+        self.os.stat = lambda x: FakeStat(101)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '1'
+
+        ro = EventBasedFileWatcher.EventBasedFileWatcher('/this/is/my/file.py', cb)
+
+        fo = EventBasedFileWatcher._MultiFileWatcher.get_singleton()
+        folder_handler = fo._observer.schedule.call_args[0][0]
+
+        self.os.stat = lambda x: FakeStat(102)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '2'
+
+        with mock.patch.object(
+                folder_handler, 'handle_file_change_event') as handle:
+            ev = events.FileModifiedEvent('/this/is/my/.file.py.swp')
+            folder_handler.dispatch(ev)
+            handle.assert_not_called()
+
+            ev = events.FileModifiedEvent('/this/is/my/file.py')
+            folder_handler.dispatch(ev)
+            handle.assert_called_once()
+
+        ro.close()
+
     def test_multiple_watchers_same_file(self):
         """Test that we can have multiple watchers of the same file."""
 
@@ -215,6 +408,53 @@ class EventBasedFileWatcherTest(unittest.TestCase):
         assert 1 == cb1.call_count
         assert 2 == cb2.call_count
 
+    def test_network_folders_are_polled(self):
+        """Test that folders on network filesystems use a PollingObserver."""
+        cb = mock.Mock()
+
+        self.os.stat = lambda x: FakeStat(101)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '1'
+        self.mock_util.folder_is_on_network_filesystem.return_value = True
+
+        with mock.patch(
+                'streamlit.watcher.EventBasedFileWatcher.PollingObserver') \
+                as MockPollingObserverClass:
+            ro = EventBasedFileWatcher.EventBasedFileWatcher(
+                '/this/is/my/file.py', cb)
+
+            fo = EventBasedFileWatcher._MultiFileWatcher.get_singleton()
+            if fo._observer is not None:
+                fo._observer.schedule.assert_not_called()
+
+            polling_observer = MockPollingObserverClass.return_value
+            polling_observer.start.assert_called_once()
+            polling_observer.schedule.assert_called_once()
+
+            ro.close()
+            polling_observer.unschedule.assert_called_once()
+
+    def test_observer_is_started_lazily(self):
+        """Test that the shared observer starts with the first watched file."""
+        EventBasedFileWatcher._MultiFileWatcher.get_singleton().close()
+
+        fo = EventBasedFileWatcher._MultiFileWatcher.get_singleton()
+        self.assertIsNone(fo._observer)
+
+        self.os.stat = lambda x: FakeStat(101)
+        self.mock_util.calc_md5_with_blocking_retries = lambda x: '1'
+
+        ro1 = EventBasedFileWatcher.EventBasedFileWatcher(
+            '/this/is/my/file.py', mock.Mock())
+        ro2 = EventBasedFileWatcher.EventBasedFileWatcher(
+            '/this/is/other/file.py', mock.Mock())
+
+        # Both files share a single, already-started observer.
+        self.MockObserverClass.assert_called_once()
+        fo._observer.start.assert_called_once()
+
+        ro1.close()
+        ro2.close()
+
 
 class FakeStat(object):
     """Emulates the output of os.stat()."""
@@ -34,3 +34,21 @@ class UtilTest(unittest.TestCase):
                    mock_open(read_data=b'hello')) as m:
             md5 = util.calc_md5_with_blocking_retries('foo')
             m.assert_called_once_with('foo', 'rb')
+
+    @patch('streamlit.watcher.util.os.path.realpath', lambda x: x)
+    @patch('streamlit.watcher.util.platform.system', lambda: 'Linux')
+    def test_folder_is_on_network_filesystem(self):
+        mounts = (
+            '/dev/sda1 / ext4 rw,relatime 0 0\n'
+            'server:/export /mnt/nfs nfs4 rw,relatime 0 0\n'
+            '/dev/sdb1 /mnt/nfs/local ext4 rw,relatime 0 0\n'
+        )
+        with patch('streamlit.watcher.util.open', mock_open(read_data=mounts)):
+            self.assertTrue(
+                util.folder_is_on_network_filesystem('/mnt/nfs/project'))
+            self.assertFalse(
+                util.folder_is_on_network_filesystem('/mnt/nfs/local/project'))
+            self.assertFalse(
+                util.folder_is_on_network_filesystem('/mnt/nfsish'))
+            self.assertFalse(
+                util.folder_is_on_network_filesystem('/home/me'))